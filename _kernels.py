@@ -0,0 +1,82 @@
+"""Numba-compiled loops behind VectorBatch (optional; needs numba).
+
+Each kernel is the plain triple loop compiled to machine code. prange splits
+the outer loop across cores, and pairwise_l2 fuses subtract/square/sum so it
+never builds the (N, N, D) temporary that the broadcast version needs.
+Sums are accumulated in the input's dtype, so float32 batches stay float32
+end to end (and get their own compiled version on first use).
+"""
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def norm_batch(A):
+    """Euclidean norm of every row of an (N, D) array."""
+    N, D = A.shape
+    out = np.empty(N, A.dtype)
+    zero = A.dtype.type(0)
+    for i in prange(N):
+        s = zero
+        for k in range(D):
+            s += A[i, k] * A[i, k]
+        out[i] = math.sqrt(s)
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def dot_batch(A, B):
+    """Row-wise dot product of two (N, D) arrays."""
+    N, D = A.shape
+    out = np.empty(N, A.dtype)
+    zero = A.dtype.type(0)
+    for i in prange(N):
+        s = zero
+        for k in range(D):
+            s += A[i, k] * B[i, k]
+        out[i] = s
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cross_batch(A, B):
+    """Row-wise cross product of two (N, 3) arrays."""
+    N = A.shape[0]
+    out = np.empty((N, 3), A.dtype)
+    for i in prange(N):
+        ax, ay, az = A[i, 0], A[i, 1], A[i, 2]
+        bx, by, bz = B[i, 0], B[i, 1], B[i, 2]
+        out[i, 0] = ay * bz - az * by
+        out[i, 1] = az * bx - ax * bz
+        out[i, 2] = ax * by - ay * bx
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def pairwise_l2(A):
+    """Distance between every pair of rows of an (N, D) array, shape (N, N)."""
+    N, D = A.shape
+    out = np.empty((N, N), A.dtype)
+    zero = A.dtype.type(0)
+    for i in prange(N):
+        # Only the upper triangle is computed; the matrix is symmetric.
+        for j in range(i, N):
+            s = zero
+            for k in range(D):
+                d = A[i, k] - A[j, k]
+                s += d * d
+            out[i, j] = out[j, i] = math.sqrt(s)
+    return out
+
+
+# Compile for float64 (VectorBatch's default) now so the first real call
+# is not paying the JIT cost. cache=True writes the machine code to
+# __pycache__, so after the first run this only loads it from disk.
+_warm = np.zeros((2, 2))
+norm_batch(_warm)
+dot_batch(_warm, _warm)
+cross_batch(np.zeros((2, 3)), np.zeros((2, 3)))
+pairwise_l2(_warm)
+del _warm
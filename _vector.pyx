@@ -0,0 +1,282 @@
+# cython: language_level=3
+"""Compiled R2Vector / R3Vector with the same API as vectors_space.py.
+
+Optional. Build it in place with
+
+    pip install cython
+    cythonize -i _vector.pyx
+
+and opt in by importing from it instead of from vectors_space:
+
+    from _vector import R2Vector, R3Vector
+
+These classes cannot be subclassed. Their methods are written for exactly
+two or three components, so a subclass that adds one (an R4Vector with a
+w slot) would get results that silently drop it. Extend the pure-Python
+classes in vectors_space.py instead.
+
+Components are stored as C doubles, so every arithmetic operator runs on
+raw machine floats with no attribute lookups. The one visible difference:
+components are always floats, so R2Vector(x=2, y=3) prints as (2.0, 3.0).
+"""
+from numbers import Real
+
+# dot_many and cross_batch share the list-to-array helper with the Python
+# classes (it only reads _fields and components), so the two stay in step.
+from vectors_space import _rows
+
+from libc.math cimport hypot
+
+
+cdef class R2Vector:
+    """2D vector in real space (ℝ²)."""
+    # readonly: Python code can read v.x but not assign it, so vectors are
+    # immutable (and hashable) just like the pure-Python version.
+    cdef readonly double x, y
+    _fields = ('x', 'y')
+    # Keep NumPy from converting vectors through __array__ in mixed operators.
+    __array_ufunc__ = None
+
+    def __init__(self, *, double x, double y):
+        # Extension types cannot refuse a subclass when it is defined, so
+        # check here: x and y are readonly from Python, so a subclass has
+        # to call this __init__ to set them (R3Vector.__init__ does too).
+        if type(self) is not R2Vector and type(self) is not R3Vector:
+            raise TypeError(
+                f"compiled {type(self).__mro__[1].__name__} cannot be subclassed; "
+                "subclass the Python classes in vectors_space.py instead"
+            )
+        self.x = x
+        self.y = y
+
+    cpdef double norm(self):
+        """Return the Euclidean norm."""
+        return hypot(self.x, self.y)
+
+    cpdef double _norm_sq(self):
+        """Return the squared Euclidean norm."""
+        return self.x * self.x + self.y * self.y
+
+    def __str__(self):
+        """Readable tuple-style representation."""
+        return str((self.x, self.y))
+
+    def __repr__(self):
+        """Constructor-style representation."""
+        return f"{self.__class__.__name__}(x={self.x}, y={self.y})"
+
+    def __add__(self, other):
+        """Add two vectors component-wise."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R2Vector o = other
+        return R2Vector(x=self.x + o.x, y=self.y + o.y)
+
+    def __sub__(self, other):
+        """Subtract two vectors component-wise."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R2Vector o = other
+        return R2Vector(x=self.x - o.x, y=self.y - o.y)
+
+    def __mul__(self, other):
+        """Multiply vectors: scalar multiplication or dot product."""
+        cdef double k
+        if isinstance(other, (int, float, Real)):
+            k = other
+            return R2Vector(x=self.x * k, y=self.y * k)
+        elif self.__class__ is other.__class__:
+            return self @ other
+        return NotImplemented
+
+    def __matmul__(self, other):
+        """Dot product: v1 @ v2."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R2Vector o = other
+        return self.x * o.x + self.y * o.y
+
+    def __eq__(self, other):
+        """Return True if all attributes are equal, False otherwise."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R2Vector o = other
+        return self.x == o.x and self.y == o.y
+
+    def __ne__(self, other):
+        """Return True if any attribute differs, False otherwise."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R2Vector o = other
+        return self.x != o.x or self.y != o.y
+
+    def __hash__(self):
+        """Hash of the components, so vectors work in sets and as dict keys."""
+        return hash((self.x, self.y))
+
+    def __lt__(self, other):
+        """Less-than comparison based on norm."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        return self._norm_sq() < (<R2Vector>other)._norm_sq()
+
+    def __le__(self, other):
+        """Less-than-or-equal-to comparison based on norm."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        return self._norm_sq() <= (<R2Vector>other)._norm_sq()
+
+    def __gt__(self, other):
+        """Greater-than comparison based on norm."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        return self._norm_sq() > (<R2Vector>other)._norm_sq()
+
+    def __ge__(self, other):
+        """Greater-than-or-equal-to comparison based on norm."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        return self._norm_sq() >= (<R2Vector>other)._norm_sq()
+
+    def __array__(self, dtype=None, copy=None):
+        """Return the components as a 1-D NumPy array (float64 by default)."""
+        if copy is False:
+            raise ValueError(
+                f"{self.__class__.__name__} cannot be viewed as an array without a copy"
+            )
+        import numpy as np
+        return np.array((self.x, self.y), dtype=np.float64 if dtype is None else dtype)
+
+    @staticmethod
+    def norm_batch(A):
+        """Return the Euclidean norm of every row of an (N, k) array."""
+        import numpy as np
+        return np.linalg.norm(np.asarray(A, dtype=np.float64), axis=-1)
+
+    @staticmethod
+    def dot_batch(A, B):
+        """Return the row-wise dot products of two (N, k) arrays."""
+        import numpy as np
+        A = np.asarray(A, dtype=np.float64)
+        B = np.asarray(B, dtype=np.float64)
+        return np.einsum('...i,...i->...', A, B)
+
+    @classmethod
+    def dot_many(cls, a, b):
+        """Return the dot product of each pair from two equal-length lists of vectors."""
+        return cls.dot_batch(_rows(a, cls), _rows(b, cls))
+
+    @classmethod
+    def from_array(cls, A):
+        """Return a list with one vector per row of an (N, k) array."""
+        import numpy as np
+        A = np.asarray(A)
+        if A.ndim != 2 or A.shape[1] != len(cls._fields):
+            raise ValueError(
+                f"{cls.__name__} needs an (N, {len(cls._fields)}) array, got shape {A.shape}"
+            )
+        return [cls(**dict(zip(cls._fields, row))) for row in A.tolist()]
+
+
+cdef class R3Vector(R2Vector):
+    """3D vector extending R2Vector with a z component."""
+    cdef readonly double z
+    _fields = ('x', 'y', 'z')
+
+    def __init__(self, *, double x, double y, double z):
+        super().__init__(x=x, y=y)
+        self.z = z
+
+    cpdef double norm(self):
+        """Return the Euclidean norm."""
+        return hypot(hypot(self.x, self.y), self.z)
+
+    cpdef double _norm_sq(self):
+        """Return the squared Euclidean norm."""
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    def __str__(self):
+        """Readable tuple-style representation."""
+        return str((self.x, self.y, self.z))
+
+    def __repr__(self):
+        """Constructor-style representation."""
+        return f"{self.__class__.__name__}(x={self.x}, y={self.y}, z={self.z})"
+
+    def __add__(self, other):
+        """Add two vectors component-wise."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R3Vector o = other
+        return R3Vector(x=self.x + o.x, y=self.y + o.y, z=self.z + o.z)
+
+    def __sub__(self, other):
+        """Subtract two vectors component-wise."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R3Vector o = other
+        return R3Vector(x=self.x - o.x, y=self.y - o.y, z=self.z - o.z)
+
+    def __mul__(self, other):
+        """Multiply vectors: scalar multiplication or dot product."""
+        cdef double k
+        if isinstance(other, (int, float, Real)):
+            k = other
+            return R3Vector(x=self.x * k, y=self.y * k, z=self.z * k)
+        elif self.__class__ is other.__class__:
+            return self @ other
+        return NotImplemented
+
+    def __matmul__(self, other):
+        """Dot product: v1 @ v2."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R3Vector o = other
+        return self.x * o.x + self.y * o.y + self.z * o.z
+
+    def __eq__(self, other):
+        """Return True if all attributes are equal, False otherwise."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R3Vector o = other
+        return self.x == o.x and self.y == o.y and self.z == o.z
+
+    def __ne__(self, other):
+        """Return True if any attribute differs, False otherwise."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R3Vector o = other
+        return self.x != o.x or self.y != o.y or self.z != o.z
+
+    def __hash__(self):
+        """Hash of the components, so vectors work in sets and as dict keys."""
+        return hash((self.x, self.y, self.z))
+
+    def __array__(self, dtype=None, copy=None):
+        """Return the components as a 1-D NumPy array (float64 by default)."""
+        if copy is False:
+            raise ValueError(
+                f"{self.__class__.__name__} cannot be viewed as an array without a copy"
+            )
+        import numpy as np
+        return np.array((self.x, self.y, self.z), dtype=np.float64 if dtype is None else dtype)
+
+    def cross(self, other):
+        """Return the cross product of two R3 vectors."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        cdef R3Vector o = other
+        return R3Vector(
+            x=self.y * o.z - self.z * o.y,
+            y=self.z * o.x - self.x * o.z,
+            z=self.x * o.y - self.y * o.x,
+        )
+
+    @classmethod
+    def cross_batch(cls, a, b):
+        """Return the row-wise cross products of two lists of R3 vectors (or (N, 3) arrays).
+
+        The bulk version of cross(): one NumPy call for all N pairs, as an (N, 3) array.
+        """
+        import numpy as np
+        return np.cross(_rows(a, cls), _rows(b, cls))
@@ -3,7 +3,22 @@
 # to improve conceptual understanding for beginners.
 # Author: Justin Guida
 
-from math import sqrt # used for __slots__ example (R5Vector)
+from math import hypot
+from numbers import Real # "any real number": int, float, Fraction, NumPy scalars, ...
+from operator import attrgetter # fetches several attributes in one C call
+from types import MemberDescriptorType # the type of a __slots__ entry
+
+# object.__setattr__ writes an attribute without going through our own
+# __setattr__ guard; __init__ and the _new fast constructors below use it.
+_set = object.__setattr__
+
+# Types that count as a scalar in v * k.
+# Real alone would be enough, but checking an abstract class like Real is
+# several times slower than checking a concrete type, and nearly every
+# scalar is a plain int or float. Listing those first lets isinstance()
+# answer them straight away; Real still catches NumPy scalars, Fraction, ...
+# Built once here so the tuple is not rebuilt on every multiplication.
+_SCALAR_TYPES = (int, float, Real)
 
 class R2Vector:
     """
@@ -26,10 +41,95 @@ class R2Vector:
             Return a constructor-style string like R2Vector(x=2, y=3).
         """
 
+    # __slots__ replaces the per-instance __dict__ with a fixed set of
+    # storage cells, one per name. Each vector is smaller in memory, and
+    # reading self.x goes straight to its cell instead of a dict lookup.
+    # Subclasses only list the names THEY add (R3Vector adds 'z').
+    # '_hash' and '_nsq' are not components: they remember the results
+    # of __hash__ and _norm_sq so those are only computed once per vector.
+    __slots__ = ('x', 'y', '_hash', '_nsq')
+
+    # Without a __dict__, vars(self) no longer works, so every method loops
+    # over this class-level tuple of component names instead.
+    # Each subclass sets its own, e.g. R3Vector uses ('x', 'y', 'z').
+    # A subclass that leaves it out gets the parent's components followed
+    # by its own public slots (see __init_subclass__), so the tuple can
+    # never silently miss a component.
+    _COMPONENTS = ('x', 'y')
+
+    # attrgetter('x', 'y') is a small C function: _attrs(v) returns (v.x, v.y)
+    # in ONE call, with no Python loop or generator behind it.
+    _attrs = attrgetter(*_COMPONENTS)
+
+    # __init_subclass__ runs once for every class that inherits from R2Vector,
+    # right after its class body. It rebuilds the helper above from the
+    # subclass's own _COMPONENTS, so R3Vector gets attrgetter('x', 'y', 'z')
+    # without writing it by hand.
+    # It also writes __str__, __repr__ and the arithmetic methods for the new
+    # components (see _specialize below the class).
+    # Repeating an inherited slot name (e.g. 'x' again in R3Vector) is an
+    # easy mistake: Python accepts it, but every instance then carries a
+    # second, unused 'x' cell. We catch that here, when the class is made.
+    def __init_subclass__(cls, **kwargs):
+        """Build the per-class helpers and arithmetic methods for a new subclass."""
+        super().__init_subclass__(**kwargs)
+        inherited = {
+            name
+            for base in cls.__mro__[1:]
+            for name in vars(base).get('__slots__', ())
+        }
+        repeated = inherited.intersection(vars(cls).get('__slots__', ()))
+        if repeated:
+            raise TypeError(
+                f"{cls.__name__}.__slots__ repeats inherited slots {sorted(repeated)}; "
+                "list only the names this class adds"
+            )
+        if '_COMPONENTS' not in vars(cls):
+            own = tuple(
+                name for name in vars(cls).get('__slots__', ())
+                if not name.startswith('_')
+            )
+            cls._COMPONENTS = cls._COMPONENTS + own
+        cls._attrs = attrgetter(*cls._COMPONENTS)
+        _specialize(cls)
+
     # Constructor to initialize the vector components x and y
+    # A brand-new vector has no components yet, so there is nothing for the
+    # __setattr__ guard below to protect. Writing with _set skips that
+    # Python-level check (one extra function call per component), the same
+    # way @dataclass(frozen=True) writes its fields in the __init__ it makes.
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        _set(self, 'x', x)
+        _set(self, 'y', y)
+
+    # Vectors are values, like numbers: 2 never turns into 3, and a vector
+    # should not change after it is built either. Python calls __setattr__
+    # for every "obj.name = value". __init__ and _new store the components
+    # with _set, which goes around this method (so do the _nsq and _hash
+    # caches). Any other assignment ends up here. A public name may be set
+    # once, so a subclass can still write "self.z = z" in its __init__;
+    # setting it again is refused. Names starting with _ are always refused,
+    # even while the slot is empty, so outside code cannot plant a bad cache.
+    def __setattr__(self, name, value):
+        """Set a component once; refuse to reassign it or touch the caches."""
+        if name.startswith('_') or hasattr(self, name):
+            raise AttributeError(
+                f"{self.__class__.__name__} is immutable; cannot set {name!r}"
+            )
+        _set(self, name, value)
+
+    def __delattr__(self, name):
+        """Refuse to delete components."""
+        raise AttributeError(
+            f"{self.__class__.__name__} is immutable; cannot delete {name!r}"
+        )
+
+    # copy, deepcopy and pickle rebuild an object by setting its attributes
+    # one by one, which __setattr__ refuses. __reduce__ tells them to call
+    # _new with the components instead, like the arithmetic methods do.
+    def __reduce__(self):
+        """Rebuild the vector from its components (for copy and pickle)."""
+        return (type(self)._new, self._attrs(self))
 
     def norm(self):
         """Compute the Euclidean norm (length) of the vector."""
@@ -45,16 +145,100 @@ class R2Vector:
 
         # The vars() built-in returns the __dict__ of an object,
         # improving readability while doing the same thing as self.__dict__.
-        return sum(val ** 2 for val in vars(self).values()) ** 0.5
+        # (Now that R2Vector uses __slots__ there is no __dict__ anymore,
+        # so this version no longer runs; the hypot line below reads the
+        # components through _attrs instead.)
+        #return sum(val ** 2 for val in vars(self).values()) ** 0.5
+
+        # Faster: math.hypot takes any number of coordinates and returns
+        # the Euclidean length in one C call, with no Python loop and no **.
+        # It is also more careful than squaring by hand: hypot(3e200, 4e200)
+        # is 5e200, while (3e200 ** 2 + 4e200 ** 2) ** 0.5 overflows to inf.
+        # _attrs(self) hands over every component of this class, so the same
+        # line works for R3Vector, R4Vector, ... without changes.
+        return hypot(*self._attrs(self))
+
+    # The squared norm x² + y² (no square root).
+    # Comparisons only need to know which vector is LONGER, and for values
+    # that are never negative, a < b exactly when a² < b².
+    # So the ordering methods below skip sqrt entirely.
+    # Sorting compares each vector many times, and a vector never changes,
+    # so the result is stored in the _nsq slot the first time and reused.
+    def _norm_sq(self):
+        """Return the squared norm, e.g. x² + y² for 2D (computed once)."""
+        # getattr with a default returns None while the slot is still empty
+        nsq = getattr(self, '_nsq', None)
+        if nsq is None:
+            nsq = self.x * self.x + self.y * self.y
+            _set(self, '_nsq', nsq)
+        return nsq
+
+    # __iter__ lets us loop over a vector: for val in v, tuple(v), x, y = v.
+    def __iter__(self):
+        """Yield the components in order, e.g. x then y."""
+        return iter(self._attrs(self))
+
+    # __len__ and __getitem__ complete the "sequence" picture:
+    # len(v) → 2, v[0] → x, v[-1] → y, v[:2] → (x, y).
+    def __len__(self):
+        """Return the number of components (the dimension)."""
+        return len(self._COMPONENTS)
+
+    def __getitem__(self, index):
+        """Return a component by position, e.g. v[0] is x."""
+        return self._attrs(self)[index]
+
+    # NumPy looks for __array__ when you call np.asarray(v) or np.array(v),
+    # so a vector turns straight into a 1-D array of its components:
+    # np.asarray(R3Vector(x=1, y=2, z=3)) → array([1., 2., 3.])
+    # NumPy is only imported here, when NumPy itself asks for it,
+    # so this file still runs without NumPy installed.
+    # The components live in slots, not in an array, so there is no buffer
+    # to share: copy=False (np.asarray(v, copy=False)) cannot be honoured.
+    def __array__(self, dtype=None, copy=None):
+        """Return the components as a 1-D NumPy array (float64 by default)."""
+        if copy is False:
+            raise ValueError(
+                f"{self.__class__.__name__} cannot be viewed as an array without a copy"
+            )
+        import numpy as np
+        return np.array(self._attrs(self), dtype=np.float64 if dtype is None else dtype)
+
+    # __array__ alone would let NumPy take over mixed operators: for
+    # np.float64(2) * v, NumPy's scalar goes first, turns v into an array
+    # and returns a bare ndarray. None tells NumPy to step aside, so Python
+    # asks our __rmul__ (or __add__, __eq__, ...) instead.
+    __array_ufunc__ = None
+
+    # Internal fast path used by the arithmetic methods.
+    # self.__class__(**kwargs) has to build a dict, parse the keyword
+    # arguments and run __init__ again. _new takes the components
+    # positionally, makes a bare instance with object.__new__ (skipping
+    # __init__) and stores them directly. Every subclass gets its own _new
+    # with its own components (see _specialize), so type(self)._new(...)
+    # always builds the right kind of vector.
+    @classmethod
+    def _new(cls, x, y):
+        """Build a vector from positional components (internal fast path)."""
+        obj = object.__new__(cls)
+        _set(obj, 'x', x)
+        _set(obj, 'y', y)
+        return obj
 
     def __str__(self):
         """Return a readable string like "(x, y)"."""
+        # Original version:
+        # return str(tuple(getattr(self, i) for i in vars(self)))
         # vars(self) → the attribute dictionary, e.g. {'x': 1, 'y': 2}
         # for i in vars(self) → loops over its keys ('x', 'y')
         # getattr(self, i) → fetches each value (1, 2) by name
         # The generator builds a tuple (1, 2)
         # str(...) converts that tuple into the string "(1, 2)".
-        return str(tuple(getattr(self, i) for i in vars(self)))
+
+        # Now _attrs(self) builds the tuple (1, 2) in a single C call.
+        # Subclasses get a one-line f-string instead, with no tuple at all,
+        # written for their own components by _specialize below.
+        return str(self._attrs(self))
 
     # __repr__ is designed to show the exact constructor-style call
     # that would recreate the same object.
@@ -62,128 +246,287 @@ class R2Vector:
     # the string form of the original constructor call.
     def __repr__(self):
         """Return an unambiguous string like R2Vector(x=2, y=3)."""
+        # Original version, rebuilt on every call:
         # loop through the attributes dictionary of the object and store in list
         # items() gives key–value pairs:
-        # for every key, value pair in that dictionary, build a formatted string like "x = 2".
-        arg_list = [f"{key} = {val}" for key, val in vars(self).items()]
-
+        # for every key, value pair in that dictionary, build a formatted string like "x=2".
+        #   arg_list = [f"{key}={val}" for key, val in vars(self).items()]
         # Join all those strings with commas to make a single argument string
-        arg_str = ", ".join(arg_list)
-
+        #   arg_str = ", ".join(arg_list)
         # Build the final string with class name and argument string
         # self.__class__.__name__ dynamically gets the actual class name of the object
-        # Example: for an R3Vector instance, it would return 'R3Vector'
-        # The formatted string then produces something like:
-        # "R2Vector(x=2, y=3)" or "R3Vector(x=2, y=3, z=4)"
-        return f"{self.__class__.__name__}({arg_str})"
+        #   return f"{self.__class__.__name__}({arg_str})"
+
+        # The class name and the "x=..., y=..." part never change for a class,
+        # so we write them straight into ONE f-string. Python compiles it
+        # to a single string-building step: no list, no join, no loop.
+        # !r asks each component for its repr(), so the output can be pasted
+        # back into Python: R2Vector(x=Fraction(1, 2), y=3), not x=1/2.
+        # (For ints and floats repr and str look the same.)
+        # Subclasses get the same one-line f-string with their own name and
+        # components, written for them by _specialize below.
+        return f"R2Vector(x={self.x!r}, y={self.y!r})"
 
     def __add__(self, other):
         """Add two vectors component-wise."""
         # Must be same type to add
-        if type(self) != type(other):
+        # "is not" asks whether they are the very same class object — a single
+        # identity check. "!=" would go through the full comparison machinery
+        # just to answer the same question.
+        if type(self) is not type(other):
             return NotImplemented
-        kwargs = {i: getattr(self, i) + getattr(other, i) for i in vars(self)}
-        return self.__class__(**kwargs)
+        # Original version (loops over the names, works for any dimension):
+        # kwargs = {i: getattr(self, i) + getattr(other, i) for i in vars(self)}
+        # return self.__class__(**kwargs)
+
+        # Faster: write the sum out for exactly x and y. No loop, no dict,
+        # no getattr() — just two additions. That only fits 2D, of course;
+        # subclasses get the same kind of code written for THEIR components
+        # automatically (see _specialize below the class).
+        return type(self)._new(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other):
         """Subtract two vectors component-wise."""
         # If not same type, cannot subtract
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
-        kwargs = {i: getattr(self, i) - getattr(other, i) for i in vars(self)}
-        return self.__class__(**kwargs)
+        return type(self)._new(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other):
         """Multiply vectors: scalar multiplication or dot product."""
         # Scalar multiplication case
-        if type(other) in (int, float):
+        # Original check: type(other) in (int, float)
+        # That misses numbers that are not EXACTLY int or float, such as
+        # numpy.float32 or fractions.Fraction, so v * np.float32(2) failed.
+        # isinstance(other, Real) accepts every real-number type;
+        # _SCALAR_TYPES (top of the file) is the same test, faster for int/float.
+        if isinstance(other, _SCALAR_TYPES):
             # x = x * number, y = y * number → returns new vector..
             # x=2*2, y=3*2
-            kwargs = {i: getattr(self, i) * other for i in vars(self)}
-            # return the vector class with the arguments unpacked
-            return self.__class__(**kwargs)
+            return type(self)._new(self.x * other, self.y * other)
 
         # Dot product case
-        elif type(self) == type(other):
+        elif type(self) is type(other):
             # Dot product
             # x1*x2 + y1*y2 -> returns scalar (e.g 2*0.5 + 3*1.25)
-            args = [getattr(self, i) * getattr(other, i) for i in vars(self)]
             # Return just the sum of the products
-            return sum(args)
+            return self.x * other.x + self.y * other.y
         
         # If we get here, types are incompatible (e.g., vector * "string")
         return NotImplemented
 
+    # 3 * v asks int.__mul__ first, which does not know about vectors and
+    # returns NotImplemented; Python then tries v.__rmul__(3) ("reflected"
+    # multiply). Scaling works the same from either side, so reuse __mul__.
+    __rmul__ = __mul__
 
     def __eq__(self, other):
         """Return True if all attributes are equal, False otherwise."""
         # You only compare vectors of the same class/type
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
-        # If the attributes are all equal for entire vars dict, return True
-        if all(getattr(self, i) == getattr(other, i) for i in vars(self)):
-            return True
-        return False
-
-    def __ne__(self, other):
-        """Return True if any attribute differs, False otherwise."""
-        # Inequality is just the opposite of equality
-        # Since we defined __eq__ and it yields a boolean
-        # we can just use a not return statement
-        return not self == other
+        # Original version: check each attribute one by one
+        # if all(getattr(self, i) == getattr(other, i) for i in vars(self)):
+        #     return True
+        # return False
+
+        # Faster: compare the two component tuples, e.g. (2, 3) == (2, 3).
+        # _attrs packs all the components into one tuple (see the top of
+        # the class), and tuples know how to compare themselves in C:
+        # the comparison stops at the first mismatch.
+        return self._attrs(self) == other._attrs(other)
+
+    # Defining __eq__ makes Python set __hash__ to None (unhashable),
+    # because equal objects MUST have equal hashes. Our vectors never change
+    # after __init__, so hashing the component tuple is safe, and vectors
+    # can go into sets and be used as dict keys:
+    # {R2Vector(1, 2), R2Vector(1, 2)} → one element.
+    def __hash__(self):
+        """Return a hash built from the components (computed once)."""
+        try:
+            return self._hash
+        except AttributeError:
+            # First call: compute it and remember it in the _hash slot.
+            h = hash(self._attrs(self))
+            _set(self, '_hash', h)
+            return h
+
+    # No __ne__ needed: inequality is just the opposite of equality,
+    # and Python 3 already builds != from __eq__ for us.
+    # (It also passes NotImplemented through correctly, which a
+    # hand-written "return not self == other" does not.)
+
+    # The four ordering methods below all follow the same pattern on the
+    # squared norm. Why not let @functools.total_ordering write three of
+    # them from __lt__? Because it assumes "neither a < b nor a == b" means
+    # a > b. Vectors are ordered by LENGTH but equal only if every component
+    # matches, so (3, 4) and (4, 3) are neither < nor == each other, and the
+    # generated __gt__ would wrongly say (3, 4) > (4, 3).
 
     # Less-than comparison based on norm
     def __lt__(self, other):
         """Less-than comparison based on norm."""
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
         # Compare the norm of current instance with the norm of the other instance
         # Since this is __lt__, it returns True if self.norm is less than other.norm
-        return self.norm() < other.norm()
+        # (compared squared, which gives the same answer without two sqrt calls)
+        return self._norm_sq() < other._norm_sq()
 
     # Greater than comparison based on norm
     def __gt__(self, other):
         """Greater-than comparison based on norm."""
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
-        return self.norm() > other.norm()
+        return self._norm_sq() > other._norm_sq()
 
     # Less than or equal to comparison based on norm
     def __le__(self, other):
         """Less-than-or-equal-to comparison based on norm."""
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
-        return not self > other
+        return self._norm_sq() <= other._norm_sq()
 
     def __ge__(self, other):
         """Greater-than-or-equal-to comparison based on norm."""
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
-        return not self < other
+        return self._norm_sq() >= other._norm_sq()
+
+# R2Vector's __repr__, _new, __add__, __sub__, __mul__ and _norm_sq are
+# written for x and y only (and its __str__ builds a tuple first).
+# A subclass such as R3Vector needs the same code with z added. Instead of
+# looping over _COMPONENTS on every call (slow) or asking every subclass to
+# rewrite seven methods by hand, we write the source code as TEXT, once per
+# class, and let Python compile it with exec(). For R3Vector, __add__ becomes:
+#
+#     def __add__(self, other):
+#         if type(self) is not type(other):
+#             return NotImplemented
+#         return type(self)._new(self.x + other.x, self.y + other.y, self.z + other.z)
+#
+# This is the same trick the dataclasses module uses to write __init__ for you.
+#
+# The generated _new also skips one more lookup. Each slot is a descriptor
+# object on the class (R2Vector.x, R3Vector.z, ...) whose __set__ writes
+# straight into the instance's cell. _set(obj, 'x', x) has to find that
+# descriptor by name on every call; the generated code is handed the bound
+# __set__ functions up front (_set_x, _set_y, ...) and calls them directly.
+# (A component stored in __dict__ instead of a slot has no such descriptor;
+# the generated code writes that one with _set.)
+_SPECIALIZED_SOURCE = """
+def __str__(self):
+    return f"({reprs})"
+
+def __repr__(self):
+    return f"{clsname}({fields})"
+
+@classmethod
+def _new(cls, {params}):
+    obj = _object_new(cls)
+    {stores}
+    return obj
+
+def __add__(self, other):
+    if type(self) is not type(other):
+        return NotImplemented
+    return type(self)._new({sums})
+
+def __sub__(self, other):
+    if type(self) is not type(other):
+        return NotImplemented
+    return type(self)._new({diffs})
+
+def __mul__(self, other):
+    if isinstance(other, _SCALAR_TYPES):
+        return type(self)._new({scaled})
+    elif type(self) is type(other):
+        return {products}
+    return NotImplemented
+
+def _norm_sq(self):
+    nsq = getattr(self, '_nsq', None)
+    if nsq is None:
+        nsq = {squares}
+        _set(self, '_nsq', nsq)
+    return nsq
+"""
+_SPECIALIZED_NAMES = ('__str__', '__repr__', '_new', '__add__', '__sub__', '__mul__', '_norm_sq')
+
+
+def _specialize(cls):
+    """Compile straight-line arithmetic methods for cls._COMPONENTS.
+
+    Methods that cls defines in its own class body are left alone.
+    """
+    names = cls._COMPONENTS
+    # Components kept in slots get their descriptor's __set__; one that
+    # lives in the instance __dict__ (a subclass without __slots__) has no
+    # descriptor, so _new writes it with _set instead.
+    slotted = {
+        n for n in names
+        if isinstance(getattr(cls, n, None), MemberDescriptorType)
+    }
+    source = _SPECIALIZED_SOURCE.format(
+        clsname=cls.__name__,
+        reprs=", ".join(f"{{self.{n}!r}}" for n in names),
+        fields=", ".join(f"{n}={{self.{n}!r}}" for n in names),
+        params=", ".join(names),
+        stores="\n    ".join(
+            f"_set_{n}(obj, {n})" if n in slotted else f"_set(obj, {n!r}, {n})"
+            for n in names
+        ),
+        sums=", ".join(f"self.{n} + other.{n}" for n in names),
+        diffs=", ".join(f"self.{n} - other.{n}" for n in names),
+        scaled=", ".join(f"self.{n} * other" for n in names),
+        products=" + ".join(f"self.{n} * other.{n}" for n in names),
+        squares=" + ".join(f"self.{n} * self.{n}" for n in names),
+    )
+    namespace = {'_set': _set, '_object_new': object.__new__,
+                 '_SCALAR_TYPES': _SCALAR_TYPES}
+    namespace.update({f"_set_{n}": getattr(cls, n).__set__ for n in slotted})
+    exec(source, namespace)
+    for name in _SPECIALIZED_NAMES:
+        if name in vars(cls):
+            continue
+        method = namespace[name]
+        func = getattr(method, '__func__', method)  # unwrap the classmethod
+        func.__qualname__ = f"{cls.__name__}.{name}"
+        func.__doc__ = getattr(R2Vector, name).__doc__
+        setattr(cls, name, method)
+    # 3 * v should use this class's own __mul__, not an inherited 2D one.
+    if '__rmul__' not in vars(cls):
+        cls.__rmul__ = cls.__mul__
+
 
 # Inheritance lets a class inherit methods and properties from a parent class
 class R3Vector(R2Vector):
     """Represents a 3D vector that inherits behavior from R2Vector."""
 
+    # x and y slots are inherited; only list the new one.
+    # Repeating 'x' or 'y' here would waste memory on a duplicate cell.
+    __slots__ = ('z',)
+    _COMPONENTS = ('x', 'y', 'z')
+
     # Since this is a 3D vector, we add one more variable z
     # * is a keyword-only argument marker
     # all parameters after * must be passed by name, not by position.
     def __init__(self, *, x, y, z):
         # super() calls the parent class (R2Vector) to initialize x and y
         super().__init__(x=x, y=y)
-        self.z = z
+        _set(self, 'z', z)  # _set, like R2Vector.__init__: no guard needed yet
 
     # A cross product is between two 3D vectors; and the result is another 3D vector.
     def cross(self, other):
         """Return the cross product of two R3 vectors."""
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
-        kwargs = {
-            'x': self.y * other.z - self.z * other.y,
-            'y': self.z * other.x - self.x * other.z,
-            'z': self.x * other.y - self.y * other.x
-        }
-        return self.__class__(**kwargs)
+        # Positional, in x, y, z order: no kwargs dict to build and unpack.
+        return type(self)._new(
+            self.y * other.z - self.z * other.y,  # x
+            self.z * other.x - self.x * other.z,  # y
+            self.x * other.y - self.y * other.x,  # z
+        )
 
 """
 Practice here making a 4D vector class that inherits from R2Vector.
@@ -193,14 +536,17 @@ It should reuse the R2Vector constructor to initialize x and y.
 class R4Vector(R2Vector):
     """Represents a 4D vector that inherits behavior from R2Vector."""
 
+    __slots__ = ('z', 'w')
+    _COMPONENTS = ('x', 'y', 'z', 'w')
+
     # Since this is a 4D vector, we add two more variables z and w
     # * is a keyword-only argument marker
     # all parameters after * must be passed by name, not by position.
     def __init__(self, *, x, y, z, w):
         # super() calls the parent class (R2Vector) to initialize x and y
         super().__init__(x=x, y=y)
-        self.z = z
-        self.w = w
+        _set(self, 'z', z)
+        _set(self, 'w', w)
 
 # 5D vector using __slots__ to save memory
 class R5Vector(R2Vector):
@@ -208,25 +554,36 @@ class R5Vector(R2Vector):
     __slots__ can't use __dict__
     One way to work around this is to explicitly list the attributes in __slots__.
     This prevents dynamic attribute creation but saves memory.
-    Ignore if unfamiliar; this is for educational purposes.
-    Typically, you'd use either __dict__ or __slots__, not both."""
-    __slots__ = ('z', 'w', 'v')  # ← drop x, y
+    R2Vector already declares the x and y slots, so only the new names go here.
+    Ignore if unfamiliar; this is for educational purposes."""
+    __slots__ = ('z', 'w', 'v')  # ← drop x, y (inherited from R2Vector)
+    # Built ONCE when the class is created, not on every method call.
+    _COMPONENTS = ('x', 'y') + __slots__
     
     def __init__(self, *, x, y, z, w, v):
-        super().__init__(x=x, y=y)  # x,y live in base __dict__
-        self.z, self.w, self.v = z, w, v
+        super().__init__(x=x, y=y)  # x,y live in the R2Vector slots
+        _set(self, 'z', z)
+        _set(self, 'w', w)
+        _set(self, 'v', v)
 
     def norm(self):
         """Compute the Euclidean norm (length) of the 5D vector."""
-        return sqrt(self.x**2 + self.y**2 + self.z**2 + self.w**2 + self.v**2)
-
-    def __str__(self):
-        """Return a readable string like "(x, y, z, w, v)"."""
-        return str((self.x, self.y, self.z, self.w, self.v))
+        # _attrs(self) rather than listing x, y, z, w, v by hand: a subclass
+        # that adds components inherits this method, and its norm has to
+        # include them (its _norm_sq, used for ordering, already does).
+        return hypot(*self._attrs(self))
+
+    # __str__ is written by _specialize as one f-string,
+    # f"({self.x!r}, {self.y!r}, {self.z!r}, {self.w!r}, {self.v!r})".
+    # Was: str((self.x, self.y, self.z, self.w, self.v)), which builds a
+    # tuple only to turn it into text. The f-string writes the text
+    # directly. str() of a tuple shows each item's repr(), so !r keeps
+    # the output exactly the same. Generating it (instead of writing it
+    # here) means a subclass that adds a component gets its own __str__.
 
     def __repr__(self):
         """Return an unambiguous string like R5Vector(x=1, y=2, z=3, w=4, v=5)."""
-        return f"R5Vector(x={self.x}, y={self.y}, z={self.z}, w={self.w}, v={self.v})"
+        return f"R5Vector(x={self.x!r}, y={self.y!r}, z={self.z!r}, w={self.w!r}, v={self.v!r})"
 
     # __add__(self, other)
     # Runs for "left + right".
@@ -240,32 +597,35 @@ class R5Vector(R2Vector):
         # Check if both vectors are of the same type
         # You can add R2Vector + R2Vector.
         # But not R2Vector + R3Vector or R5Vector + int
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
             
-        # With __slots__, the instance does not expose a __dict__,
-        # so we loop directly over the defined slot names (x, y, z, w, v).
-        component_names = self.__slots__
-        # Build a dictionary of summed components keyed by the slot names.
-        summed_values = {
-            name: getattr(self, name) + getattr(other, name)
-            for name in component_names
-        }
-        # pass **summed_values to unpack into keyword arguments
-        return self.__class__(**summed_values) # example R5Vector(x=6, y=9, ...)
+        # __slots__ only lists the NEW names (z, w, v); x and y come from
+        # R2Vector. A 5D vector always has exactly these five components,
+        # so we write the five additions out by hand: no loop, no getattr()
+        # calls, no temporary list — just attribute reads and +.
+        # The results go to _new positionally, in x, y, z, w, v order.
+        return type(self)._new(
+            self.x + other.x,
+            self.y + other.y,
+            self.z + other.z,
+            self.w + other.w,
+            self.v + other.v,
+        )  # example R5Vector(x=6, y=9, ...)
 
     def __sub__(self, other):
         """Vector subtraction of two vectors of the same type."""
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
             
-        # Iterate over __slots__ so we can access every stored component.
-        component_names = self.__slots__
-        diff_values = {
-            name: getattr(self, name) - getattr(other, name)
-            for name in component_names
-        }
-        return self.__class__(**diff_values)
+        # Same as __add__, with - instead of +.
+        return type(self)._new(
+            self.x - other.x,
+            self.y - other.y,
+            self.z - other.z,
+            self.w - other.w,
+            self.v - other.v,
+        )
 
     def __mul__(self, other):
         """
@@ -280,42 +640,41 @@ class R5Vector(R2Vector):
         This changes the vector's magnitude but not its direction.
         """
         # Scalar multiplication case
-        if type(other) in (int, float):
+        if isinstance(other, _SCALAR_TYPES):
             # x = x * number, y = y * number → returns new vector.
-            # Iterate over __slots__ so we hit every stored coordinate.
-            scaled_values = {
-                name: getattr(self, name) * other
-                for name in self.__slots__
-            }
-            # return the vector class with the arguments unpacked
-            return self.__class__(**scaled_values)
+            return type(self)._new(
+                self.x * other,
+                self.y * other,
+                self.z * other,
+                self.w * other,
+                self.v * other,
+            )
 
         # Dot product case
-        elif type(self) == type(other):
+        elif type(self) is type(other):
             # Dot product
             # x1*x2 + y1*y2 -> returns scalar
             # 2*0.5 + 3*1.25
-            # Iterate over the slot names to pair up every component.
-            args = [
-                getattr(self, name) * getattr(other, name)
-                for name in self.__slots__
-            ]
-            # return just the sum of the products
-            return sum(args)
+            # We know there are exactly five components, so we can write
+            # the whole sum out by hand: no getattr() calls, no temporary
+            # list, and no sum() loop — just five multiplies and four adds.
+            return (self.x * other.x + self.y * other.y + self.z * other.z
+                    + self.w * other.w + self.v * other.v)
             
         # If we get here, types are incompatible (e.g., vector * "string")
         return NotImplemented
 
 
 # 6D vector using __slots__, using show_attributes method to display attributes
-# We could inherit, but we are using slots on top of dict-based attributes,
-# So we have to reimplement methods anyway.
+# We could inherit everything, but we reimplement the methods here
+# to show how the inherited slots (x, y) and the new ones fit together.
 class R6Vector(R2Vector):
     """Represents a 6D vector using __slots__ for memory efficiency.
     Uses show_attr method to display attributes, without having
     to explicitly reference each attribute."""
 
     __slots__ = ('z', 'w', 'v', 'u')  # Only need to list new attributes
+    _COMPONENTS = ('x', 'y') + __slots__  # ('x', 'y', 'z', 'w', 'v', 'u')
 
     # So @staticmethod tells Python: “This function lives inside the
     # class for organization, but don’t give it self.”
@@ -323,79 +682,86 @@ class R6Vector(R2Vector):
     # affecting instances with self.
     @staticmethod
     def show_attr(obj):
-        # Get regular attributes (for classes that have __dict__)
-        dict_attrs = getattr(obj, "__dict__", {})
-
-        # Get slotted attributes (for classes that use __slots__)
-        slot_attrs = {
-            name: getattr(obj, name)
-            for name in getattr(obj, "__slots__", ())
-            if name != "__dict__"
-        }
-
-        # Combine both into one dictionary and return it
-        return {**dict_attrs, **slot_attrs}
+        """Return the vector's components as a {name: value} dict."""
+        # Original version: merge two dicts, one from __dict__ (classes
+        # without slots) and one built by walking the MRO for slot names,
+        # because each class only lists the slots IT adds:
+        #   dict_attrs = getattr(obj, "__dict__", {})
+        #   slot_attrs = {name: getattr(obj, name)
+        #                 for klass in reversed(type(obj).__mro__)
+        #                 for name in getattr(klass, "__slots__", ())
+        #                 if not name.startswith("_")}
+        #   return {**dict_attrs, **slot_attrs}
+
+        # Every vector already knows its component names (_COMPONENTS) and
+        # has an attrgetter that reads them all in one call (_attrs), so zip
+        # the two together and build the dict in one step.
+        return dict(zip(obj._COMPONENTS, obj._attrs(obj)))
 
     # Constructor for R6Vector
     def __init__(self, *, x, y, z, w, v, u):
         super().__init__(x=x, y=y)
-        # You can also initialize attributes all in one clean line
-        self.z, self.w, self.v, self.u = z, w, v, u
+        # "self.z, self.w, self.v, self.u = z, w, v, u" would also work, but
+        # each of those goes through the __setattr__ guard; _set does not.
+        _set(self, 'z', z)
+        _set(self, 'w', w)
+        _set(self, 'v', v)
+        _set(self, 'u', u)
 
     def norm(self):
         """Compute the Euclidean norm (length) across all six components."""
-        # Gather each component explicitly so readers can see what is included.
-        components = (self.x, self.y, self.z, self.w, self.v, self.u)
-        # Square each value, sum them, then take the square root.
-        # coord is each component in the tuple.
-        return sqrt(sum(coord ** 2 for coord in components))
+        # _attrs is attrgetter('x', 'y', 'z', 'w', 'v', 'u'): one C call
+        # hands back all six components as a tuple, in order.
+        # hypot squares each value, sums them and takes the square root
+        # in one C call: no generator, no ** per coordinate.
+        return hypot(*self._attrs(self))
 
-    def __str__(self):
-        """Return a readable string like \"(x, y, z, w, v, u)\"."""
-        # Build the coordinate tuple in order so print(v5) looks complete.
-        coordinates = (self.x, self.y, self.z, self.w, self.v, self.u)
-        return str(coordinates)
+    # __str__ comes from _specialize, as for R5Vector: one f-string.
 
     def __repr__(self):
         """Return an unambiguous string like R6Vector(x=..., y=..., ...)."""
         # Format each field explicitly to mirror the constructor signature.
         return (
             "R6Vector("
-            f"x={self.x}, y={self.y}, z={self.z}, "
-            f"w={self.w}, v={self.v}, u={self.u}"
+            f"x={self.x!r}, y={self.y!r}, z={self.z!r}, "
+            f"w={self.w!r}, v={self.v!r}, u={self.u!r}"
             ")"
         )
 
     # Reuse the same educational commentary style as R5Vector,
-    # but note how we stitch together the inherited (__dict__) fields
+    # but note how we stitch together the inherited slot fields (x, y)
     # and the extra __slots__ fields (z, w, v, u).
     # v1 + v2  -->  v1.__add__(v2)
     #              ^self         ^other (what's on the RIGHT of +)
     # Adds matching fields and returns a NEW object.
     def __add__(self, other):
         """Vector addition of two R6Vector instances."""
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
             
-        # Combine the base-class attributes ('x', 'y') with this class's slots.
-        # We do this because R6Vector inherits x and y from R2Vector,
-        component_names = ('x', 'y') + self.__slots__
-        summed_values = {
-            name: getattr(self, name) + getattr(other, name)
-            for name in component_names
-        }
-        return self.__class__(**summed_values)
+        # x and y are the base-class attributes; z, w, v, u are this class's
+        # slots. We need all six because R6Vector inherits x and y from R2Vector.
+        return type(self)._new(
+            self.x + other.x,
+            self.y + other.y,
+            self.z + other.z,
+            self.w + other.w,
+            self.v + other.v,
+            self.u + other.u,
+        )
 
     def __sub__(self, other):
         """Vector subtraction keeping all six coordinates."""
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
-        component_names = ('x', 'y') + self.__slots__
-        diff_values = {
-            name: getattr(self, name) - getattr(other, name)
-            for name in component_names
-        }
-        return self.__class__(**diff_values)
+        return type(self)._new(
+            self.x - other.x,
+            self.y - other.y,
+            self.z - other.z,
+            self.w - other.w,
+            self.v - other.v,
+            self.u - other.u,
+        )
 
     def __mul__(self, other):
         """
@@ -405,46 +771,25 @@ class R6Vector(R2Vector):
         When both sides are vectors of the same type,
         we compute the dot product by multiplying and summing each coordinate.
         """
-        component_names = ('x', 'y') + self.__slots__
-
-        if type(other) in (int, float):
-            scaled_values = {
-                name: getattr(self, name) * other
-                for name in component_names
-            }
-            return self.__class__(**scaled_values)
-
-        elif type(self) == type(other):
-            products = [
-                getattr(self, name) * getattr(other, name)
-                for name in component_names
-            ]
-            return sum(products)
+        if isinstance(other, _SCALAR_TYPES):
+            return type(self)._new(
+                self.x * other,
+                self.y * other,
+                self.z * other,
+                self.w * other,
+                self.v * other,
+                self.u * other,
+            )
+
+        elif type(self) is type(other):
+            # Written out in full, like R5Vector: six products, one expression.
+            return (self.x * other.x + self.y * other.y + self.z * other.z
+                    + self.w * other.w + self.v * other.v + self.u * other.u)
 
         return NotImplemented
 
-    def __eq__(self, other):
-        """Check equality of two vectors."""
-        if type(self) != type(other):
-            return NotImplemented
-        component_names = ('x', 'y') + self.__slots__
-        return all(getattr(self, name) == getattr(other, name) for name in component_names)
-
-    def __ne__(self, other):
-        """Check inequality of two vectors."""
-        return not self == other
-
-    def __lt__(self, other):
-        """Less-than comparison based on norm."""
-        if type(self) != type(other):
-            return NotImplemented
-        return self.norm() < other.norm()
-
-    def __ge__(self, other):
-        """Greater-than-or-equal-to comparison based on norm."""
-        if type(self) != type(other):
-            return NotImplemented
-        return not self < other
+    # ==, !=, <, <=, > and >= are all inherited from R2Vector: they work
+    # through _COMPONENTS and _norm_sq, so they already cover all six values.
 
 if __name__ == "__main__":
     # 2D vectors
@@ -480,10 +825,14 @@ if __name__ == "__main__":
     print(v2)
     print(v2.norm())
 
-    # 3) __dict__ contents (note: slotted classes won't show all fields here)
-    print("\nv1 and v2 __dict__ contents:")
-    print("v1.__dict__:", v1.__dict__)
-    print("v2.__dict__:", v2.__dict__)
+    # 3) __slots__ instead of __dict__ (the components live in fixed slots)
+    print("\nv1 and v2 have no __dict__; their components live in __slots__:")
+    print("hasattr(v1, '__dict__'):", hasattr(v1, '__dict__'))
+    print("R2Vector._COMPONENTS:", R2Vector._COMPONENTS)
+    # The other two slots are private caches, not components.
+    print("R2Vector.__slots__:", R2Vector.__slots__,
+          "(_hash and _nsq cache hash(v) and the squared norm)")
+    print("v2 component values:", {name: getattr(v2, name) for name in R2Vector._COMPONENTS})
 
     # 4) repr vs str vs f'!r'
     print("\nrepr(v1), str(v1), and f'{v1!r}':")
@@ -524,6 +873,8 @@ if __name__ == "__main__":
     print(f'v1 != v2: {v1 != v2}')
     print('v1 == R2Vector(x=2, y=3):', v1 == R2Vector(x=2, y=3))
     print('v1 != R2Vector(x=2, y=3):', v1 != R2Vector(x=2, y=3))
+    # Equal vectors hash the same, so a set keeps only one of them
+    print('len({v1, v2, R2Vector(x=2, y=3)}):', len({v1, v2, R2Vector(x=2, y=3)}))
 
     print("\nComparison Checks")
     print("-------------------------")
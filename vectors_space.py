@@ -1,120 +1,399 @@
+from math import hypot
+from numbers import Real
+from types import MemberDescriptorType
+
+# Writes an attribute without going through R2Vector.__setattr__.
+_set = object.__setattr__
+_new = object.__new__
+# Numbers accepted as scalars by __mul__. int and float come first so the
+# common cases never reach the slower abstract Real check; Real adds
+# NumPy scalars such as np.float32, Fraction, and so on.
+_SCALAR_TYPES = (int, float, Real)
+
+
 class R2Vector:
-    """2D vector in real space (ℝ²)."""
+    """2D vector in real space (ℝ²).
+
+    Do not define __getattribute__ or __getattr__ here: without them, v.x
+    is a single C-level slot read, and every method reads components.
+    """
+    # Fixed storage cells instead of a per-instance __dict__: smaller
+    # objects and faster attribute access. Subclasses list only new names.
+    __slots__ = ('x', 'y')
+    # Without __dict__, vars(self) is gone; methods loop over _fields.
+    _fields = ('x', 'y')
+
+    # Runs once per subclass, right after its class body. The arithmetic
+    # below is written out for x and y; _specialize writes the same methods
+    # for the subclass's own _fields, so R3Vector gets a three-term __add__
+    # without a loop and without writing it by hand.
+    def __init_subclass__(cls, **kwargs):
+        """Compile the arithmetic methods for a new subclass's components."""
+        super().__init_subclass__(**kwargs)
+        if '_fields' not in vars(cls):
+            # Public slots only: a private one (say a _cache) is not a component.
+            own = tuple(
+                name for name in vars(cls).get('__slots__', ())
+                if not name.startswith('_')
+            )
+            cls._fields = cls._fields + own
+        _specialize(cls)
+
     def __init__(self, *, x, y):
-        self.x = x
-        self.y = y
+        _set(self, 'x', x)
+        _set(self, 'y', y)
+
+    # Positional constructor for the arithmetic methods: no keyword binding
+    # and no __init__ call, just a bare object with its slots filled in.
+    @classmethod
+    def _make(cls, x, y):
+        """Build a vector from positional components."""
+        obj = _new(cls)
+        _set_x(obj, x)
+        _set_y(obj, y)
+        return obj
+
+    # Vectors are values: once built they never change, which is what makes
+    # them safe to hash (below) and to use as set members or dict keys.
+    # A component may still be set once, so a subclass's __init__ can write
+    # "self.w = w" after calling super().__init__; reassigning it is refused.
+    def __setattr__(self, name, value):
+        """Set a component once; refuse to change it afterwards."""
+        if name.startswith('_') or hasattr(self, name):
+            raise AttributeError(f"{self.__class__.__name__} is immutable")
+        _set(self, name, value)
+
+    def __delattr__(self, name):
+        """Refuse to delete components."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    # copy, deepcopy and pickle would otherwise restore the slots through
+    # __setattr__; rebuilding through _make skips it.
+    def __reduce__(self):
+        """Rebuild the vector from its components (for copy and pickle)."""
+        return (self._make, tuple(getattr(self, f) for f in self._fields))
 
     def norm(self):
         """Return the Euclidean norm."""
-        return sum(val ** 2 for val in vars(self).values()) ** 0.5
+        return hypot(self.x, self.y)
+
+    # x² + y² without the square root. Lengths are never negative, so
+    # comparing squared norms orders vectors exactly like comparing norms.
+    def _norm_sq(self):
+        """Return the squared Euclidean norm."""
+        return self.x * self.x + self.y * self.y
 
     def __str__(self):
         """Readable tuple-style representation."""
-        return str(tuple(getattr(self, i) for i in vars(self)))
+        return str(tuple(getattr(self, i) for i in self._fields))
 
     def __repr__(self):
         """Constructor-style representation."""
-        args = ", ".join(f"{k}={v}" for k, v in vars(self).items())
+        args = ", ".join(f"{k}={getattr(self, k)}" for k in self._fields)
         return f"{self.__class__.__name__}({args})"
 
-    #def __getattribute__(self, attr):
-        #"""Intercepts all lookups. Delegate to keep normal behavior."""
-        #return object.__getattribute__(self, attr)
-    #def __getattr__(self, attr):
-        #"""Called only if attribute not found normally."""
-        #return f'No attribute named {attr}'
-
     def __add__(self, other):
         """Add two vectors component-wise."""
         # Must be same type to add
-        if type(self) != type(other):
+        if self.__class__ is not other.__class__:
             return NotImplemented
-        kwargs = {i: getattr(self, i) + getattr(other, i) for i in vars(self)}
-        return self.__class__(**kwargs)
+        return self._make(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other):
         """Subtract two vectors component-wise."""
         # If not same type, cannot subtract
-        if type(self) != type(other):
+        if self.__class__ is not other.__class__:
             return NotImplemented
-        kwargs = {i: getattr(self, i) - getattr(other, i) for i in vars(self)}
-        return self.__class__(**kwargs)
+        return self._make(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other):
         """Multiply vectors: scalar multiplication or dot product."""
         # Scalar multiplication case
-        if type(other) in (int, float):
+        if isinstance(other, _SCALAR_TYPES):
             # x = x * number, y = y * number → returns new vector..
             # x=2*2, y=3*2
-            kwargs = {i: getattr(self, i) * other for i in vars(self)}
-            # return the vector class with the arguments unpacked
-            return self.__class__(**kwargs)
-
-        # Dot product case
-        elif type(self) == type(other):
-            # Dot product
-            # x1*x2 + y1*y2 -> returns scalar (e.g 2*0.5 + 3*1.25)
-            args = [getattr(self, i) * getattr(other, i) for i in vars(self)]
-            # Return just the sum of the products
-            return sum(args)
+            return self._make(self.x * other, self.y * other)
+
+        # Dot product case (kept for v1 * v2; v1 @ v2 goes straight there)
+        elif self.__class__ is other.__class__:
+            return self.x * other.x + self.y * other.y
         # If we get here, types are incompatible (e.g., vector * "string")
         return NotImplemented
 
+    def __matmul__(self, other):
+        """Dot product: v1 @ v2, without the scalar check of __mul__."""
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        # x1*x2 + y1*y2 -> returns scalar (e.g 2*0.5 + 3*1.25)
+        return self.x * other.x + self.y * other.y
+
     def __eq__(self, other):
         """Return True if all attributes are equal, False otherwise."""
-        if type(self) != type(other):
+        if self.__class__ is not other.__class__:
             return NotImplemented
-        if all(getattr(self, i) == getattr(other, i) for i in vars(self)):
-            return True
-        return False
+        # One C-level tuple comparison; stops at the first mismatch.
+        return (self.x, self.y) == (other.x, other.y)
+
+    # Equal vectors must hash equal; hashing the component tuple does that.
+    def __hash__(self):
+        """Hash of the components, so vectors work in sets and as dict keys."""
+        return hash((self.x, self.y))
 
     def __ne__(self, other):
         """Return True if any attribute differs, False otherwise."""
-        return not self == other
+        # Same guard and tuple compare as __eq__, rather than "not self == other",
+        # which runs __eq__ through a second round of operator dispatch.
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        return (self.x, self.y) != (other.x, other.y)
 
     def __lt__(self, other):
         """Less-than comparison based on norm."""
-        if type(self) != type(other):
+        if self.__class__ is not other.__class__:
             return NotImplemented
-        return self.norm() < other.norm()
+        return self._norm_sq() < other._norm_sq()
 
     def __le__(self, other):
         """Less-than-or-equal-to comparison based on norm."""
-        if type(self) != type(other):
+        if self.__class__ is not other.__class__:
             return NotImplemented
-        return self.norm() <= other.norm()
+        return self._norm_sq() <= other._norm_sq()
 
     def __gt__(self, other):
         """Greater-than comparison based on norm."""
-        if type(self) != type(other):
+        if self.__class__ is not other.__class__:
             return NotImplemented
-        return self.norm() > other.norm()
+        return self._norm_sq() > other._norm_sq()
 
     def __ge__(self, other):
         """Greater-than-or-equal-to comparison based on norm."""
-        if type(self) != type(other):
+        if self.__class__ is not other.__class__:
             return NotImplemented
-        return self.norm() >= other.norm()
+        return self._norm_sq() >= other._norm_sq()
+
+    # np.asarray(v) and np.stack([v1, v2, ...]) call this to get a vector's
+    # components as a 1-D array. NumPy is imported only when NumPy asks.
+    # The components are slots, not a buffer, so copy=False cannot be met.
+    def __array__(self, dtype=None, copy=None):
+        """Return the components as a 1-D NumPy array (float64 by default)."""
+        if copy is False:
+            raise ValueError(
+                f"{self.__class__.__name__} cannot be viewed as an array without a copy"
+            )
+        import numpy as np
+        return np.array((self.x, self.y), dtype=np.float64 if dtype is None else dtype)
+
+    # Without this, v * np.float32(2) or v == ndarray would be taken over by
+    # NumPy, which converts v through __array__ and returns a bare ndarray.
+    __array_ufunc__ = None
+
+    # Bulk helpers for many vectors at once, stored as rows of an (N, 2) or
+    # (N, 3) NumPy array: one C loop instead of one method call per vector.
+    # NumPy is imported only here, so the classes themselves don't need it.
+    @staticmethod
+    def norm_batch(A):
+        """Return the Euclidean norm of every row of an (N, k) array."""
+        import numpy as np
+        return np.linalg.norm(np.asarray(A, dtype=np.float64), axis=-1)
+
+    @staticmethod
+    def dot_batch(A, B):
+        """Return the row-wise dot products of two (N, k) arrays."""
+        import numpy as np
+        A = np.asarray(A, dtype=np.float64)
+        B = np.asarray(B, dtype=np.float64)
+        # einsum multiplies and sums in one pass, without the (N, k)
+        # temporary that (A * B).sum(-1) builds first.
+        return np.einsum('...i,...i->...', A, B)
+
+    @classmethod
+    def dot_many(cls, a, b):
+        """Return the dot product of each pair from two equal-length lists of vectors.
+
+        The bulk version of v1 @ v2: one NumPy call instead of N method calls.
+        """
+        return cls.dot_batch(_rows(a, cls), _rows(b, cls))
+
+    @classmethod
+    def from_array(cls, A):
+        """Return a list with one vector per row of an (N, k) array."""
+        import numpy as np
+        A = np.asarray(A)
+        if A.ndim != 2 or A.shape[1] != len(cls._fields):
+            raise ValueError(
+                f"{cls.__name__} needs an (N, {len(cls._fields)}) array, got shape {A.shape}"
+            )
+        # tolist() gives plain Python numbers, not NumPy scalars.
+        return [cls._make(*row) for row in A.tolist()]
+
+
+# The slot descriptors' own setters: they write the slot directly, skipping
+# both __setattr__ and the name lookup that object.__setattr__ does.
+_set_x = R2Vector.x.__set__
+_set_y = R2Vector.y.__set__
+
+
+# R2Vector's methods for any _fields, filled in by _specialize.
+_SPECIALIZED_SOURCE = """
+@classmethod
+def _make(cls, {params}):
+    obj = _new(cls)
+    {stores}
+    return obj
+
+def norm(self):
+    return hypot({comps})
+
+def _norm_sq(self):
+    return {squares}
+
+def __add__(self, other):
+    if self.__class__ is not other.__class__:
+        return NotImplemented
+    return self._make({sums})
+
+def __sub__(self, other):
+    if self.__class__ is not other.__class__:
+        return NotImplemented
+    return self._make({diffs})
+
+def __mul__(self, other):
+    if isinstance(other, _SCALAR_TYPES):
+        return self._make({scaled})
+    elif self.__class__ is other.__class__:
+        return {products}
+    return NotImplemented
+
+def __matmul__(self, other):
+    if self.__class__ is not other.__class__:
+        return NotImplemented
+    return {products}
 
+def __eq__(self, other):
+    if self.__class__ is not other.__class__:
+        return NotImplemented
+    return ({comps},) == ({others},)
+
+def __ne__(self, other):
+    if self.__class__ is not other.__class__:
+        return NotImplemented
+    return ({comps},) != ({others},)
+
+def __hash__(self):
+    return hash(({comps},))
+
+def __array__(self, dtype=None, copy=None):
+    if copy is False:
+        raise ValueError(
+            f"{{self.__class__.__name__}} cannot be viewed as an array without a copy"
+        )
+    import numpy as np
+    return np.array(({comps},), dtype=np.float64 if dtype is None else dtype)
+"""
+_SPECIALIZED_NAMES = (
+    '_make', 'norm', '_norm_sq', '__add__', '__sub__', '__mul__',
+    '__matmul__', '__eq__', '__ne__', '__hash__', '__array__',
+)
+
+
+def _specialize(cls):
+    """Compile straight-line arithmetic methods for cls._fields.
+
+    Methods that cls defines in its own class body are left alone.
+    """
+    names = cls._fields
+    # Components kept in slots get their descriptor's __set__; one that
+    # lives in the instance __dict__ (a subclass without __slots__) has no
+    # descriptor, so _new writes it with _set instead.
+    slotted = {
+        n for n in names
+        if isinstance(getattr(cls, n, None), MemberDescriptorType)
+    }
+    source = _SPECIALIZED_SOURCE.format(
+        params=", ".join(names),
+        stores="\n    ".join(
+            f"_set_{n}(obj, {n})" if n in slotted else f"_set(obj, {n!r}, {n})"
+            for n in names
+        ),
+        comps=", ".join(f"self.{n}" for n in names),
+        others=", ".join(f"other.{n}" for n in names),
+        squares=" + ".join(f"self.{n} * self.{n}" for n in names),
+        sums=", ".join(f"self.{n} + other.{n}" for n in names),
+        diffs=", ".join(f"self.{n} - other.{n}" for n in names),
+        scaled=", ".join(f"self.{n} * other" for n in names),
+        products=" + ".join(f"self.{n} * other.{n}" for n in names),
+    )
+    namespace = {'_new': _new, '_set': _set, 'hypot': hypot,
+                 '_SCALAR_TYPES': _SCALAR_TYPES}
+    namespace.update({f"_set_{n}": getattr(cls, n).__set__ for n in slotted})
+    exec(source, namespace)
+    for name in _SPECIALIZED_NAMES:
+        if name in vars(cls):
+            continue
+        method = namespace[name]
+        func = getattr(method, '__func__', method)  # unwrap the classmethod
+        func.__qualname__ = f"{cls.__name__}.{name}"
+        func.__doc__ = getattr(R2Vector, name).__doc__
+        setattr(cls, name, method)
+
+
+def _rows(vectors, cls):
+    """Return a list of cls vectors as an (N, k) float64 array.
+
+    Arrays and plain rows of numbers are passed to NumPy unchanged. Vectors
+    must be exactly cls, the same rule the operators apply to v1 + v2.
+    """
+    import numpy as np
+    if isinstance(vectors, np.ndarray):
+        return vectors.astype(np.float64, copy=False)
+    vectors = list(vectors)
+    if not vectors:
+        # Keep the (0, k) shape, so results are empty arrays, not a 0.0 sum.
+        return np.empty((0, len(cls._fields)))
+    if not hasattr(vectors[0], '_fields'):
+        return np.asarray(vectors, dtype=np.float64)
+    for v in vectors:
+        if v.__class__ is not cls:
+            raise TypeError(
+                f"expected {cls.__name__} vectors, got {v.__class__.__name__}"
+            )
+    return np.array([[getattr(v, f) for f in cls._fields] for v in vectors], dtype=np.float64)
 
 
 class R3Vector(R2Vector):
     """3D vector extending R2Vector with a z component."""
+    __slots__ = ('z',)
+    _fields = ('x', 'y', 'z')
+
     def __init__(self, *, x, y, z):
         super().__init__(x=x, y=y)
-        self.z = z
+        _set(self, 'z', z)
 
     # A cross product is between two 3D vectors; and the result is another 3D vector.
     def cross(self, other):
         """Return the cross product of two R3 vectors."""
-        if type(self) != type(other):
+        if self.__class__ is not other.__class__:
             return NotImplemented
-        kwargs = {
-            'x': self.y * other.z - self.z * other.y,
-            'y': self.z * other.x - self.x * other.z,
-            'z': self.x * other.y - self.y * other.x
-        }
-        return self.__class__(**kwargs)
+        return self._make(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    @classmethod
+    def cross_batch(cls, a, b):
+        """Return the row-wise cross products of two lists of R3 vectors (or (N, 3) arrays).
+
+        The bulk version of cross(): one NumPy call for all N pairs, as an (N, 3) array.
+        """
+        import numpy as np
+        return np.cross(_rows(a, cls), _rows(b, cls))
+
+
+# Guard for the docstring note above: a Python-level __getattribute__
+# would slow every component read in every method.
+assert R2Vector.__getattribute__ is object.__getattribute__
+
 
 if __name__ == "__main__":
     # Instantiate vectors
@@ -130,7 +409,7 @@ if __name__ == "__main__":
     v3 = v1 + v2
     v4 = v1 - v2
     v5 = v1 * 3          # Scalar multiplication
-    v6 = v1 * v2         # Dot product
+    v6 = v1 @ v2         # Dot product (v1 * v2 works too)
 
     print("Vector Instances")
     print("-------------------------")
@@ -148,7 +427,7 @@ if __name__ == "__main__":
 
     print("\nDot product")
     print("-------------------------")
-    print(f'v1 * v2 = {v6}')
+    print(f'v1 @ v2 = {v6}')
 
     print("\nEquality Checks")
     print("-------------------------")